@@ -5,29 +5,32 @@ Uses Unity MCP server to run playmode tests
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import re
 import time
 import sys
 
 MCP_URL = "http://localhost:8080/mcp/v1"
 
+# Test-related log filters ("Test" stays case-sensitive, the rest is not)
+_TEST_LOG_RE = re.compile(r"Test|(?i:special gem)")
+_FINAL_LOG_RE = re.compile(r"Test|(?i:special gem|pool)")
+
+# Reuse one keep-alive connection for every MCP call in a test run
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# JSON-RPC envelope is identical for every call; only name and arguments vary
+_ENVELOPE = '{"jsonrpc":"2.0","id":1,"method":"tools/call","params":{"name":%s,"arguments":%s}}'
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 def call_mcp_tool(tool_name, arguments=None):
     """Call an MCP tool"""
-    if arguments is None:
-        arguments = {}
-    
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "tools/call",
-        "params": {
-            "name": tool_name,
-            "arguments": arguments
-        }
-    }
+    body = _ENVELOPE % (json.dumps(tool_name), json.dumps(arguments) if arguments else "{}")
     
     try:
-        response = requests.post(MCP_URL, json=payload, timeout=30)
+        response = _session.post(MCP_URL, data=body.encode("utf-8"), headers=_JSON_HEADERS, timeout=30)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -134,7 +137,7 @@ def run_playmode_test():
         test_logs = []
         for log in logs.get("logs", []):
             message = log.get("message", "")
-            if "[Test]" in message or "Test" in message or "special gem" in message.lower():
+            if _TEST_LOG_RE.search(message):
                 test_logs.append(log)
         
         if test_logs:
@@ -164,7 +167,7 @@ def run_playmode_test():
         test_logs = []
         for log in logs.get("logs", []):
             message = log.get("message", "")
-            if "[Test]" in message or "Test" in message or "special gem" in message.lower() or "pool" in message.lower():
+            if _FINAL_LOG_RE.search(message):
                 test_logs.append(log)
         
         if test_logs:
@@ -172,6 +175,8 @@ def run_playmode_test():
                 log_type = log.get("type", "Log")
                 message = log.get("message", "")
                 print(f"[{log_type}] {message}")
+    else:
+        print("Final log fetch failed")
     
     # Step 5: Exit play mode
     print("\n" + "="*60)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Checks for scripts/run_playmode_test.py log handling
+Run with: python -m unittest discover tests
+
+MCP calls are stubbed, so a stand-in requests module is enough to import the script.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+_requests = types.ModuleType("requests")
+_requests.Session = mock.MagicMock
+_adapters = types.ModuleType("requests.adapters")
+_adapters.HTTPAdapter = mock.MagicMock
+_requests.adapters = _adapters
+
+with mock.patch.dict(sys.modules, {"requests": _requests, "requests.adapters": _adapters}):
+    import run_playmode_test
+
+
+def make_logs(messages, log_type="Log"):
+    """Console entries without timestamps, as Unity often returns them"""
+    return {"logs": [{"type": log_type, "message": message} for message in messages]}
+
+
+class FinalReportTests(unittest.TestCase):
+    def run_with_logs(self, *fetches):
+        """Run the test sequence with stubbed MCP calls, return the final report lines"""
+        output = io.StringIO()
+        with mock.patch.multiple(
+            run_playmode_test,
+            get_editor_state=mock.Mock(return_value={"ok": True}),
+            check_compile_errors=mock.Mock(return_value=True),
+            play_game=mock.Mock(return_value=True),
+            stop_game=mock.Mock(return_value=True),
+            get_logs=mock.Mock(side_effect=list(fetches)),
+        ), mock.patch.object(run_playmode_test.time, "sleep"), contextlib.redirect_stdout(output):
+            run_playmode_test.run_playmode_test()
+        report = output.getvalue().split("Final test results:")[1].split("Test sequence complete!")[0]
+        return [line for line in report.splitlines() if line and not line.startswith("=")]
+
+    def test_repeated_messages_are_kept(self):
+        lines = self.run_with_logs(
+            make_logs(["Test tick"] * 3),
+            make_logs(["Test tick"] * 8 + ["Test passed"]),
+        )
+        self.assertEqual(lines, ["[Log] Test tick"] * 8 + ["[Log] Test passed"])
+
+    def test_final_report_uses_latest_fetch(self):
+        lines = self.run_with_logs(
+            make_logs(["Test step"]),
+            make_logs(["Test step"], log_type="Error"),
+        )
+        self.assertEqual(lines, ["[Error] Test step"])
+
+    def test_failed_final_fetch_is_reported(self):
+        lines = self.run_with_logs(make_logs(["Test tick"]), None)
+        self.assertEqual(lines, ["Final log fetch failed"])
+
+
+if __name__ == "__main__":
+    unittest.main()